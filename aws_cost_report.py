@@ -0,0 +1,353 @@
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import boto3
+import pandas as pd
+import xlsxwriter
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+
+# Cost Explorer responses for closed periods are cached here; each request is billed.
+# In practice only TotalCostsReport hits it: ProjectServiceReport's request includes the open month
+CACHE_DIR = 'ce_cache'
+# Days a period must have been closed before it is cached: CE data lags and month-close
+# items (credits, refunds, tax, RI fees) land on the 1st or later
+CACHE_SETTLE_DAYS = 5
+
+
+# Project tag keys come back from Cost Explorer as 'Project$<value>'
+def project_name(key):
+    return key[8:] if key.startswith('Project$') else 'No Project Tag'
+
+
+# Base class for cost reports
+class CostReport:
+    # One Cost Explorer client per process, shared by every report
+    _CLIENT = None
+    # Account the cached responses belong to, looked up once per process
+    _ACCOUNT_ID = None
+
+    def __init__(self, output_file, use_cache=True):
+        self.client = self._get_client()
+        self.output_file = output_file
+        self.use_cache = use_cache
+
+    @staticmethod
+    def _get_client():
+        if CostReport._CLIENT is None:
+            CostReport._CLIENT = boto3.Session().client('ce', region_name='ca-central-1')
+        return CostReport._CLIENT
+
+    @staticmethod
+    def _get_account_id():
+        if CostReport._ACCOUNT_ID is None:
+            CostReport._ACCOUNT_ID = boto3.Session().client('sts').get_caller_identity()['Account']
+        return CostReport._ACCOUNT_ID
+
+    def fetch_cost_data(self, time_period, group_by):
+        # Returns one ResultsByTime entry per month in time_period, with all pages of Groups merged
+        query = dict(TimePeriod=time_period, Granularity='MONTHLY', Metrics=['UnblendedCost'], GroupBy=group_by)
+        cached = self._read_cache(query)
+        if cached is not None:
+            return cached
+        results_by_time = {}
+        kwargs = dict(query)
+        while True:
+            response = self.client.get_cost_and_usage(**kwargs)
+            for result in response['ResultsByTime']:
+                start = result['TimePeriod']['Start']
+                if start in results_by_time:
+                    results_by_time[start]['Groups'].extend(result['Groups'])
+                else:
+                    results_by_time[start] = {'TimePeriod': result['TimePeriod'], 'Groups': list(result['Groups'])}
+            token = response.get('NextPageToken')
+            if not token:
+                break
+            kwargs['NextPageToken'] = token
+        # Chronological order, so callers can rely on [0] being the older month
+        results = [results_by_time[start] for start in sorted(results_by_time)]
+        self._write_cache(query, results)
+        return results
+
+    @staticmethod
+    def check_month_count(results_by_time, time_period, expected=2):
+        # A short response (or a stale cache file) would otherwise fail later as a bare unpacking error
+        if len(results_by_time) != expected:
+            raise ValueError(f"Expected {expected} months of Cost Explorer results for {time_period['Start']} to "
+                             f"{time_period['End']}, got {len(results_by_time)}")
+
+    def _is_cacheable(self, query):
+        # Only periods that closed at least CACHE_SETTLE_DAYS ago; until then CE may still revise them
+        settled = (datetime.today() - timedelta(days=CACHE_SETTLE_DAYS)).strftime('%Y-%m-%d')
+        return self.use_cache and query['TimePeriod']['End'] <= settled
+
+    def _cache_path(self, query):
+        # Key on the account and region too, so switching credentials never serves another account's costs
+        scoped_query = dict(query, Account=self._get_account_id(), Region=self.client.meta.region_name)
+        key = hashlib.sha1(json.dumps(scoped_query, sort_keys=True).encode()).hexdigest()
+        return os.path.join(CACHE_DIR, f"{key}.json")
+
+    def _read_cache(self, query):
+        if not self._is_cacheable(query):
+            return None
+        path = self._cache_path(query)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def _write_cache(self, query, results):
+        if not self._is_cacheable(query):
+            return
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            try:
+                json.dump(results, f)
+            except Exception:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, self._cache_path(query))
+
+    @staticmethod
+    def add_difference_rules(sheet, first_row, last_row, red_fill, green_fill):
+        # Excel colours the Difference column (D) itself: red for cost exceeded, green for cost saved;
+        # zero keeps the cell's own format
+        for criteria, fill in (('>', red_fill), ('<', green_fill)):
+            sheet.conditional_format(first_row, 3, last_row, 3, {'type': 'cell', 'criteria': criteria, 'value': 0,
+                                                                 'format': fill})
+
+    def generate_report(self):
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+# Projectwise report class
+class ProjectServiceReport(CostReport):
+    def get_time_periods(self):
+        current_month = datetime.now().replace(day=1)
+        previous_month = (current_month - timedelta(days=1)).replace(day=1)
+        time_period_current = {
+            'Start': current_month.strftime('%Y-%m-%d'),
+            'End': (current_month + relativedelta(months=1)).strftime('%Y-%m-%d')
+        }
+        time_period_previous = {
+            'Start': previous_month.strftime('%Y-%m-%d'),
+            'End': (previous_month + relativedelta(months=1)).strftime('%Y-%m-%d')
+        }
+        return time_period_current, time_period_previous
+
+    def process_data(self, results_by_time):
+        cost_data_previous, cost_data_current = results_by_time[0]['Groups'], results_by_time[1]['Groups']
+        frames = []
+        for period, cost_data in (('Current Cost', cost_data_current), ('Previous Cost', cost_data_previous)):
+            records = [{'Key0': item['Keys'][0], 'Key1': item['Keys'][1],
+                        'Amount': item['Metrics']['UnblendedCost']['Amount']} for item in cost_data]
+            frame = pd.DataFrame.from_records(records, columns=['Key0', 'Key1', 'Amount'])
+            frame['Period'] = period
+            frames.append(frame)
+        df = pd.concat(frames, ignore_index=True)
+        df['Amount'] = pd.to_numeric(df['Amount'])
+        df['Project'] = df['Key0'].str.slice(8).where(df['Key0'].str.startswith('Project$'), 'No Project Tag')
+        df['Service'] = df['Key1']
+        project_costs = df.pivot_table(index=['Project', 'Service'], columns='Period', values='Amount',
+                                       aggfunc='sum', fill_value=0)
+        # A month with no usage yet (e.g. on the 1st) has no column at all
+        return project_costs.reindex(columns=['Current Cost', 'Previous Cost'], fill_value=0)
+
+    def generate_excel(self, project_costs, time_period_previous, time_period_current):
+        title = f"Report Period: {time_period_previous['Start']} to {time_period_previous['End']} & " \
+                f"{time_period_current['Start']} to {time_period_current['End']}"
+        with xlsxwriter.Workbook(self.output_file) as workbook:
+            title_format = workbook.add_format({'bg_color': '#FFFFE0', 'border': 1,
+                                                'align': 'center', 'valign': 'vcenter'})
+            light_yellow = workbook.add_format({'bg_color': '#FFFFE0', 'border': 1})
+            light_cyan = workbook.add_format({'bg_color': '#E0FFFF', 'border': 1})
+            red_fill = workbook.add_format({'bg_color': '#FFCCCC'})
+            green_fill = workbook.add_format({'bg_color': '#C6EFCE'})
+            used_lower = set()
+            report = pd.DataFrame({
+                'Current Cost (USD)': project_costs['Current Cost'].round(2),
+                'Previous Cost (USD)': project_costs['Previous Cost'].round(2),
+                'Difference (USD)': (project_costs['Current Cost'] - project_costs['Previous Cost']).round(2)
+            })
+            for project, costs in report.groupby(level='Project', sort=False):
+                sheet_name = self.get_unique_sheet_name(project, used_lower)
+                df = costs.reset_index(level='Project', drop=True).reset_index()
+                df = df.sort_values(by='Current Cost (USD)', ascending=False)
+                total_current_cost, total_previous_cost = \
+                    df[['Current Cost (USD)', 'Previous Cost (USD)']].sum().to_numpy()
+                total_difference = total_current_cost - total_previous_cost
+
+                sheet = workbook.add_worksheet(sheet_name)
+                sheet.merge_range(0, 0, 0, 3, title, title_format)
+                sheet.write(2, 0, df.columns[0], light_yellow)
+                sheet.write_row(2, 1, list(df.columns[1:]), light_cyan)
+                for row_num, (service, current_cost, previous_cost, difference) in enumerate(
+                        df.itertuples(index=False, name=None), start=3):
+                    sheet.write(row_num, 0, service, light_yellow)
+                    sheet.write_row(row_num, 1, (current_cost, previous_cost, difference), light_cyan)
+                last_row = 3 + len(df)
+                sheet.write(last_row, 0, 'Total', light_yellow)
+                sheet.write_row(last_row, 1, [round(total_current_cost, 2), round(total_previous_cost, 2),
+                                              round(total_difference, 2)], light_cyan)
+                self.add_difference_rules(sheet, 3, last_row, red_fill, green_fill)
+                sheet.set_column(0, 3, 30)
+
+        print(f"Consolidated report saved as {self.output_file}")
+
+    def generate_report(self):
+        time_period_current, time_period_previous = self.get_time_periods()
+        group_by = [{'Type': 'TAG', 'Key': 'Project'}, {'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+        # One request covering both months; Cost Explorer returns a ResultsByTime entry for each
+        time_period = {'Start': time_period_previous['Start'], 'End': time_period_current['End']}
+        results_by_time = self.fetch_cost_data(time_period, group_by)
+        self.check_month_count(results_by_time, time_period)
+        project_costs = self.process_data(results_by_time)
+        self.generate_excel(project_costs, time_period_previous, time_period_current)
+
+    @staticmethod
+    def get_unique_sheet_name(project, used_lower):
+        base_name = project[:28] if project.strip() else 'Unnamed_Project'
+        sheet_name = base_name
+        counter = 1
+        while sheet_name.lower() in used_lower:
+            sheet_name = f"{base_name}_{counter}"
+            counter += 1
+        used_lower.add(sheet_name.lower())
+        return sheet_name
+
+
+# AWS Account total cost report class
+class TotalCostsReport(CostReport):
+    def get_date_ranges(self):
+        today = datetime.today()
+        current_month_start = datetime(today.year, today.month, 1)
+        first_month_start = current_month_start - relativedelta(months=1)
+        first_month_end = current_month_start - timedelta(days=1)
+        second_month_start = current_month_start - relativedelta(months=2)
+        second_month_end = first_month_start - timedelta(days=1)
+        return {
+            "first_month": {
+                "start_date": second_month_start.strftime('%Y-%m-%d'),
+                "end_date": second_month_end.strftime('%Y-%m-%d'),
+            },
+            "second_month": {
+                "start_date": first_month_start.strftime('%Y-%m-%d'),
+                "end_date": first_month_end.strftime('%Y-%m-%d'),
+            },
+            # Cost Explorer's End is exclusive: the first of the current month covers both months in full
+            "exclusive_end_date": current_month_start.strftime('%Y-%m-%d'),
+        }
+
+    def process_data(self, results_by_time):
+        first_month_data, second_month_data = results_by_time[0]['Groups'], results_by_time[1]['Groups']
+        first_month_costs = {project_name(item['Keys'][0]): float(item['Metrics']['UnblendedCost']['Amount'])
+                             for item in first_month_data}
+        second_month_costs = {project_name(item['Keys'][0]): float(item['Metrics']['UnblendedCost']['Amount'])
+                              for item in second_month_data}
+
+        all_projects = set(first_month_costs.keys()).union(second_month_costs.keys())
+        data = []
+        for project in all_projects:
+            first_cost = first_month_costs.get(project, 0)
+            second_cost = second_month_costs.get(project, 0)
+            data.append({
+                'Project': project,
+                f"Cost of {self.second_month['start_date']} to {self.second_month['end_date']}": round(second_cost, 2),
+                f"Cost of {self.first_month['start_date']} to {self.first_month['end_date']}": round(first_cost, 2),
+                'Difference': round(first_cost - second_cost, 2)
+            })
+        df = pd.DataFrame(data)
+        total_first, total_second = df[[
+            f"Cost of {self.first_month['start_date']} to {self.first_month['end_date']}",
+            f"Cost of {self.second_month['start_date']} to {self.second_month['end_date']}"
+        ]].sum().to_numpy()
+        total_difference = total_first - total_second
+        totals_row = pd.DataFrame({
+            'Project': ['Total'],
+            f"Cost of {self.second_month['start_date']} to {self.second_month['end_date']}": [round(total_second, 2)],
+            f"Cost of {self.first_month['start_date']} to {self.first_month['end_date']}": [round(total_first, 2)],
+            'Difference': [round(total_difference, 2)]
+        })
+        return pd.concat([df, totals_row], ignore_index=True)
+
+    def generate_excel(self, merged_df):
+        title = f"Report Period: {self.first_month['start_date']} to {self.first_month['end_date']} & " \
+                f"{self.second_month['start_date']} to {self.second_month['end_date']}"
+        with xlsxwriter.Workbook(self.output_file) as workbook:
+            title_format = workbook.add_format({'bg_color': '#FFFFE0', 'border': 1,
+                                                'align': 'center', 'valign': 'vcenter'})
+            first_month_fill = workbook.add_format({'bg_color': '#FFFFE0', 'border': 1})
+            second_month_fill = workbook.add_format({'bg_color': '#E0FFFF', 'border': 1})
+            red_fill = workbook.add_format({'bg_color': '#FFCCCC'})
+            green_fill = workbook.add_format({'bg_color': '#C6EFCE'})
+
+            sheet = workbook.add_worksheet('Report')
+            sheet.merge_range(0, 0, 0, 3, title, title_format)
+            sheet.write(2, 0, merged_df.columns[0], first_month_fill)
+            sheet.write_row(2, 1, list(merged_df.columns[1:]), second_month_fill)
+            for row_num, (project, *costs) in enumerate(merged_df.itertuples(index=False, name=None), start=3):
+                sheet.write(row_num, 0, project, first_month_fill)
+                sheet.write_row(row_num, 1, costs, second_month_fill)
+            self.add_difference_rules(sheet, 3, len(merged_df) + 2, red_fill, green_fill)
+            sheet.set_column(0, 3, 30)
+
+        print(f"Report saved as {self.output_file}")
+
+    def generate_report(self):
+        date_ranges = self.get_date_ranges()
+        self.first_month = date_ranges["first_month"]
+        self.second_month = date_ranges["second_month"]
+        group_by = [{'Type': 'TAG', 'Key': 'Project'}]
+        # One request covering both months
+        time_period = {'Start': self.first_month['start_date'], 'End': date_ranges["exclusive_end_date"]}
+        results_by_time = self.fetch_cost_data(time_period, group_by)
+        self.check_month_count(results_by_time, time_period)
+        merged_df = self.process_data(results_by_time)
+        self.generate_excel(merged_df)
+
+
+# Display the menu
+def display_menu():
+    print("\nSelect a cost report type:")
+    print("1. AWS Account total cost report")
+    print("2. Projectwise cost report")
+    print("3. Exit")
+
+
+# Command-line options shared by the menu and the standalone report scripts; returns use_cache
+def parse_use_cache(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"always query Cost Explorer instead of reusing responses cached in {CACHE_DIR}/ "
+                             "(only the total cost report covers closed months and uses the cache)")
+    args = parser.parse_args()
+    return not args.no_cache
+
+
+# Main function to handle user interaction
+def main():
+    use_cache = parse_use_cache("Generate AWS cost reports from Cost Explorer.")
+    while True:
+        display_menu()
+        choice = input("Pick an option (1-3): ")
+        if choice == '1':
+            output_file = 'AWS_Project_Cost_Report_with_Difference_and_Totals.xlsx'
+            report = TotalCostsReport(output_file, use_cache=use_cache)
+            report.generate_report()
+        elif choice == '2':
+            output_file = 'Projectwise_Cost_Report.xlsx'
+            report = ProjectServiceReport(output_file, use_cache=use_cache)
+            report.generate_report()
+        elif choice == '3':
+            print("Exiting the program.")
+            break
+        else:
+            print("[Invalid Selection] select an option from the list.")
+
+
+# Run the program
+if __name__ == "__main__":
+    main()